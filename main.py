@@ -21,7 +21,7 @@ class SymbolTable(dict):
     A mapping of {variable name: value}
     """
 
-    def __init__(self, params, args, outer_scope=None):
+    def __init__(self, params=(), args=(), outer_scope=None):
         self.update(zip(params, args))
         self.outer_scope = outer_scope
 
@@ -34,6 +34,46 @@ class SymbolTable(dict):
             raise NameError(f"NameError: name '{var}' is not defined")
 
 
+class Closure:
+    """
+    A function value created by `lambda`.
+
+    Only the free variables referenced by the lambda body are captured,
+    as a flat tuple of values, so a closure never keeps its enclosing
+    symbol table alive.
+    """
+
+    __slots__ = ("params", "func_body", "free_vars", "captured")
+
+    def __init__(self, params, func_body, free_vars, captured):
+        self.params = params
+        self.func_body = func_body
+        self.free_vars = free_vars
+        self.captured = captured
+
+    def __repr__(self):
+        return f"<lambda ({' '.join(self.params)})>"
+
+
+class Lambda:
+    """
+    A `lambda` expression in the abstract syntax tree.
+
+    The free variables of the body are computed once, when the expression
+    is parsed, and reused by every closure created from it.
+    """
+
+    __slots__ = ("params", "func_body", "free_vars")
+
+    def __init__(self, params, func_body, free_vars):
+        self.params = params
+        self.func_body = func_body
+        self.free_vars = free_vars
+
+    def __repr__(self):
+        return f"<lambda ({' '.join(self.params)})>"
+
+
 global_symbol_table = SymbolTable()
 global_symbol_table.update(
     {
@@ -148,6 +188,8 @@ def generate_ast(tokens: List) -> List:
         while tokens[0] != ")":
             ast.append(generate_ast(tokens))
         tokens.pop(0)  # pop off ')'
+        if len(ast) > 0 and ast[0] == "lambda":
+            return parse_lambda(ast)
         return ast
     elif t == ")":
         raise SyntaxError("Mismatched parens.")
@@ -155,6 +197,85 @@ def generate_ast(tokens: List) -> List:
         return atomize(t)
 
 
+def are_params_valid(params) -> bool:
+    """Check that `params` is a list of Symbols."""
+    return isinstance(params, List) and all(isinstance(p, Symbol) for p in params)
+
+
+def parse_lambda(x: List) -> Lambda:
+    """
+    Turn a `lambda` expression into a Lambda node, computing
+    the free variables of its body.
+
+    Example:
+    x = ['lambda', ['x'], ['+', 'x', 'n']]
+    -->
+    Lambda(params=['x'], func_body=['+', 'x', 'n'], free_vars=('+', 'n'))
+
+    Raises:
+        SyntaxError: If `x` is not of the form (lambda (params) body)
+    """
+    if len(x) != 3 or not are_params_valid(x[1]):
+        raise SyntaxError(
+            f'Lambda expression "{x}" must have the form (lambda (params) body).'
+        )
+    params, func_body = x[1:3]
+    return Lambda(
+        params, func_body, tuple(free_variables(func_body, frozenset(params)))
+    )
+
+
+def free_variables(x: Exp, bound=frozenset()) -> List[str]:
+    """
+    Collect the symbols referenced in `x` that are not bound by `bound`
+    or by a nested `lambda`/`defun`, in order of first appearance.
+
+    Example:
+    x = ['+', 'x', 'n'], bound = {'x'}
+    -->
+    ['+', 'n']
+
+    Raises:
+        SyntaxError: If a nested `defun` is not of the form
+        (defun name (params) body)
+    """
+    free = []
+    seen = set()
+
+    def walk(x, bound):
+        if isinstance(x, Symbol):
+            if x not in bound and x not in seen:
+                seen.add(x)
+                free.append(x)
+        elif isinstance(x, Lambda):
+            # nested lambdas already know their own free variables
+            for var in x.free_vars:
+                walk(var, bound)
+        elif isinstance(x, List) and len(x) > 0:
+            if x[0] == "defun":
+                if (
+                    len(x) != 4
+                    or not isinstance(x[1], Symbol)
+                    or not are_params_valid(x[2])
+                ):
+                    raise SyntaxError(
+                        f'Function definition "{x}" must have the form (defun name (params) body).'
+                    )
+                walk(x[3], bound | {x[1]} | set(x[2]))
+            elif x[0] == "format":
+                # only a trailing sub-expression is evaluated by `format`
+                if isinstance(x[-1], List):
+                    walk(x[-1], bound)
+            else:
+                if x[0] != "if":
+                    walk(x[0], bound)
+                for arg in x[1:]:
+                    walk(arg, bound)
+
+    walk(x, bound)
+    return free
+
+
 def eval(x: Exp, st=global_symbol_table):
     """Evaluate the abstract syntax tree"""
     if isinstance(x, Number):
@@ -164,14 +285,28 @@ def eval(x: Exp, st=global_symbol_table):
         # to find symbol definition, searching outer scope until
         # symbol definition is found
         return st.find(x)
+    elif isinstance(x, Lambda):
+        # Example:
+        #   "(lambda (x) (+ x n))" -->
+        #   `params`: ["x"]
+        #   `func_body`: ["+", "x", "n"]
+        #   `free_vars`: ("+", "n")
+        # capture only free variables bound in a local scope; globals
+        # (builtins, functions from `defun`) are looked up at call time
+        free_vars, captured = [], []
+        for var in x.free_vars:
+            scope = st
+            while scope is not None and var not in scope:
+                scope = scope.outer_scope
+            if scope is None or scope is global_symbol_table:
+                continue
+            free_vars.append(var)
+            captured.append(scope[var])
+        return Closure(x.params, x.func_body, tuple(free_vars), tuple(captured))
     elif x[0] == "if":
         condition, statement, alternative = x[1:4]
-        expression = (
-            statement
-            if eval(condition, SymbolTable(st.keys(), st.values(), st))
-            else alternative
-        )
-        return eval(expression, SymbolTable(st.keys(), st.values(), st))
+        expression = statement if eval(condition, st) else alternative
+        return eval(expression, st)
     elif x[0] == "defun":
         # `func_name`: str
         # `params`: List[str]
@@ -186,7 +321,7 @@ def eval(x: Exp, st=global_symbol_table):
         return f"Defined function: {func_name.upper()}"
     elif x[0] == "format":
         if isinstance(x[-1], list):
-            fill_val = eval(x[-1], SymbolTable(st.keys(), st.values(), st))
+            fill_val = eval(x[-1], st)
             res = " ".join(str(i) for i in x[2:-1])
         else:
             fill_val = ""
@@ -198,19 +333,35 @@ def eval(x: Exp, st=global_symbol_table):
         return res
     else:
         func_name = x[0]
-        func = eval(x[0], SymbolTable(st.keys(), st.values(), st))
-        args = [eval(arg, SymbolTable(st.keys(), st.values(), st)) for arg in x[1:]]
+        func = eval(x[0], st)
+        args = [eval(arg, st) for arg in x[1:]]
 
-        # if `func` is a tuple, it is a user defined function, so update local scoping
-        # of symbol table with user-provided parameters
+        # if `func` is a tuple, it is a user defined function, so bind the
+        # user-provided parameters in a new local scope on top of the global scope
         if isinstance(func, tuple):
             params, func_body = func
             if len(args) != len(params):
                 raise ValueError(
                     f'Function "{func_name}" expects {len(params)} arguments, but {len(args)} were provided.'
                 )
-            st.update(zip(params, args))
-            return eval(func_body, SymbolTable(st.keys(), st.values(), st))
+            return eval(func_body, SymbolTable(params, args, global_symbol_table))
+        # if `func` is a Closure, evaluate its body in a fresh scope holding only
+        # the captured free variables and the arguments, on top of the global scope
+        elif isinstance(func, Closure):
+            if len(args) != len(func.params):
+                if not isinstance(func_name, Symbol):
+                    func_name = repr(func)
+                raise ValueError(
+                    f'Function "{func_name}" expects {len(func.params)} arguments, but {len(args)} were provided.'
+                )
+            return eval(
+                func.func_body,
+                SymbolTable(
+                    func.free_vars + tuple(func.params),
+                    func.captured + tuple(args),
+                    global_symbol_table,
+                ),
+            )
         elif isinstance(func, (int, float, str)):
             return func
         else:
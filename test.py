@@ -9,6 +9,9 @@ from main import (
     tokenize,
     generate_ast,
     eval,
+    free_variables,
+    global_symbol_table,
+    SymbolTable,
 )
 
 Symbol = str
@@ -335,6 +338,18 @@ class TestPyLispInterpreter(TestCase):
             ["(fib 8)", 21],
             ["(fib 9)", 34],
             ["(fib 10)", 55],
+            # lambda and closures
+            ["((lambda (x) (* x x)) 5)", 25],
+            ["((lambda (a b) (+ a b)) 20 22)", 42],
+            ["((lambda () 42))", 42],
+            ["(defun adder (n) (lambda (x) (+ x n)))", "Defined function: ADDER"],
+            ["((adder 3) 4)", 7],
+            ["(defun compose (f g) (lambda (x) (f (g x))))", "Defined function: COMPOSE"],
+            ["((compose doublen (adder 1)) 5)", 12],
+            ["(defun apply_twice (f x) (f (f x)))", "Defined function: APPLY_TWICE"],
+            ["(apply_twice (lambda (x) (* x 3)) 2)", 18],
+            ["(apply_twice (adder 10) 1)", 21],
+            ["(((lambda (a) (lambda (b) (- a b))) 10) 4)", 6],
             # format t
             [
                 '(format t "The double of 5 is ~D~%" (doublen 5))',
@@ -350,6 +365,75 @@ class TestPyLispInterpreter(TestCase):
         res = eval(generate_ast(tokenize(input)))
         self.assertEqual(res, expected_output)
 
+    @parameterized.expand(
+        [
+            ["(* x x)", ["x"], ["*"]],
+            ["(+ x n)", ["x"], ["+", "n"]],
+            ["(f (g x))", ["x"], ["f", "g"]],
+            ["(lambda (b) (- a b))", [], ["-", "a"]],
+            ["(if (< n 2) n m)", [], ["<", "n", "m"]],
+            ['(format t "The value is ~D~%" (doublen k))', [], ["doublen", "k"]],
+        ]
+    )
+    def test_free_variables(
+        self, input: str, bound: List, expected_output: List
+    ) -> None:
+        res = free_variables(generate_ast(tokenize(input)), frozenset(bound))
+        self.assertEqual(res, expected_output)
+
+    def test_closure_captures_only_free_variables(self) -> None:
+        self.addCleanup(global_symbol_table.pop, "make_scaler", None)
+        eval(generate_ast(tokenize("(defun make_scaler (k unused) (lambda (x) (* x k)))")))
+        closure = eval(generate_ast(tokenize("(make_scaler 3 99)")))
+        self.assertEqual(closure.free_vars, ("k",))
+        self.assertEqual(closure.captured, (3,))
+
+    def test_closure_captures_shadowed_global(self) -> None:
+        for name in ["triple", "wrap"]:
+            self.addCleanup(global_symbol_table.pop, name, None)
+        eval(generate_ast(tokenize("(defun triple (n) (* n 3))")))
+        eval(generate_ast(tokenize("(defun wrap (triple) (lambda (x) (triple x)))")))
+        closure = eval(generate_ast(tokenize("(wrap triple)")))
+        self.assertEqual(closure.free_vars, ("triple",))
+        # redefining the global must not affect the captured parameter
+        eval(generate_ast(tokenize("(defun triple (n) 0)")))
+        scope = SymbolTable(["wrapped"], [closure], global_symbol_table)
+        self.assertEqual(eval(generate_ast(tokenize("(wrapped 1)")), scope), 3)
+
+    def test_closure_does_not_see_caller_locals(self) -> None:
+        for name in ["get_m", "call_with_m"]:
+            self.addCleanup(global_symbol_table.pop, name, None)
+        eval(generate_ast(tokenize("(defun get_m (n) (lambda () m))")))
+        eval(generate_ast(tokenize("(defun call_with_m (m) ((get_m 1)))")))
+        with self.assertRaises(NameError):
+            eval(generate_ast(tokenize("(call_with_m 5)")))
+
+    def test_defun_params_do_not_leak(self) -> None:
+        self.addCleanup(global_symbol_table.pop, "quadruple", None)
+        eval(generate_ast(tokenize("(defun quadruple (n) (* n 4))")))
+        self.assertEqual(eval(generate_ast(tokenize("(quadruple 2)"))), 8)
+        with self.assertRaises(NameError):
+            eval(generate_ast(tokenize("n")))
+
+    @parameterized.expand(
+        [
+            ["(lambda xy xy)"],
+            ["(lambda (x))"],
+            ["(lambda (x) x x)"],
+            ["(lambda (1) 1)"],
+            ["(lambda (y) (lambda (x)))"],
+            ["((lambda () (lambda 1 2)))"],
+            ["(lambda () (defun f))"],
+        ]
+    )
+    def test_lambda_throws_errors(self, input: str) -> None:
+        with self.assertRaises(SyntaxError):
+            eval(generate_ast(tokenize(input)))
+
+    def test_closure_arity_error_names_lambda(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'Function "<lambda \\(x\\)>"'):
+            eval(generate_ast(tokenize("((lambda (x) x))")))
+
 
 if __name__ == "__main__":
     unittest.main()